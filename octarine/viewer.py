@@ -1,7 +1,6 @@
 import png
 import time
 import cmap
-import uuid
 import random
 import inspect
 import warnings
@@ -14,7 +13,7 @@ from collections import OrderedDict
 
 from wgpu.gui.offscreen import WgpuCanvas as WgpuCanvasOffscreen
 
-from .visuals import mesh2gfx, volume2gfx, points2gfx, lines2gfx, text2gfx
+from .visuals import mesh2gfx, volume2gfx, points2gfx, lines2gfx, text2gfx, _next_object_id
 from .conversion import get_converter
 from . import utils, config
 
@@ -984,7 +983,7 @@ class Viewer:
 
         # Add custom attributes
         box._object_type = "boundingbox"
-        box._object_id = uuid.uuid4()
+        box._object_id = _next_object_id()
 
         self.scene.add(box)
 
@@ -1117,7 +1116,7 @@ class Viewer:
         else:
             visual = mesh
 
-        visual._object_id = name if name else uuid.uuid4()
+        visual._object_id = name if name else _next_object_id()
 
         self._add_to_scene(visual, center)
 
@@ -1176,7 +1175,7 @@ class Viewer:
         visual = points2gfx(
             points, color=color, size=size, size_space=size_space, marker=marker
         )
-        visual._object_id = name if name else uuid.uuid4()
+        visual._object_id = name if name else _next_object_id()
 
         self._add_to_scene(visual, center)
 
@@ -1244,7 +1243,7 @@ class Viewer:
             color=color,
             dash_pattern=linestyle,
         )
-        visual._object_id = name if name else uuid.uuid4()
+        visual._object_id = name if name else _next_object_id()
         self._add_to_scene(visual, center)
 
     def add_volume(
@@ -1334,9 +1333,9 @@ class Viewer:
             interpolation=interpolation,
             hide_zero=hide_zero,
         )
-        name = name if name else uuid.uuid4()
+        name = name if name else _next_object_id()
         for vis in visuals:
-            vis._object_id = name if name else uuid.uuid4()
+            vis._object_id = name if name else _next_object_id()
             self._add_to_scene(vis, center)
 
     def close(self):
@@ -1587,26 +1586,33 @@ class Viewer:
         """
         objects = self.objects  # grab once to speed things up
         if isinstance(c, (tuple, list, np.ndarray, str)):
-            cmap = {s: c for s in objects}
+            # Single color for all objects: parse it only once instead of
+            # once per visual
+            col = gfx.Color(c)
+            uniform = (gfx.Color(col.rgba), gfx.Color(col.rgb))
+            cmap = None
         elif isinstance(c, dict):
+            uniform = None
             cmap = c
         else:
             raise TypeError(f'Unable to use colors of type "{type(c)}"')
 
         for n in objects:
-            if n in cmap:
-                for v in objects[n]:
-                    if getattr(v, "_pinned", False):
-                        continue
-                    if not hasattr(v, "material"):
-                        continue
-                    # Note: there is currently a bug where removing or adding an alpha
-                    # channel from a color will break the rendering pipeline
-                    if len(v.material.color) == 4:
-                        new_c = gfx.Color(cmap[n]).rgba
-                    else:
-                        new_c = gfx.Color(cmap[n]).rgb
-                    v.material.color = gfx.Color(new_c)
+            if uniform is None and n not in cmap:
+                continue
+            for v in objects[n]:
+                if getattr(v, "_pinned", False):
+                    continue
+                if not hasattr(v, "material"):
+                    continue
+                # Note: there is currently a bug where removing or adding an alpha
+                # channel from a color will break the rendering pipeline
+                if uniform is not None:
+                    v.material.color = uniform[0 if len(v.material.color) == 4 else 1]
+                elif len(v.material.color) == 4:
+                    v.material.color = gfx.Color(gfx.Color(cmap[n]).rgba)
+                else:
+                    v.material.color = gfx.Color(gfx.Color(cmap[n]).rgb)
 
     def colorize(self, palette="seaborn:tab10", objects=None, randomize=True):
         """Colorize objects using a color palette.
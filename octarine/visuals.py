@@ -1,16 +1,127 @@
 import uuid
 import cmap
+import weakref
+import itertools
 
 import pygfx as gfx
 import numpy as np
 import trimesh as tm
 
+from functools import lru_cache
 from importlib.util import find_spec
 
 from . import config, utils
 
 logger = config.get_logger(__name__)
 
+# Float32/int32 arrays generated for Trimeshes (see `_mesh_arrays`) keyed by
+# the ID of the mesh
+_TRIMESH_ARRAYS = {}
+
+# Textures generated by `texture_from_pillow_image` keyed by the ID of the
+# source image (and dimensionality)
+_PILLOW_TEXTURES = {}
+
+# Counter for object IDs - cheaper than uuid.uuid4() which reads from os.urandom
+_OBJECT_IDS = itertools.count(1)
+
+# Separator inserted between lines in `lines2gfx`
+_NAN_ROW = np.full((1, 3), np.nan, dtype=np.float32)
+_NAN_ROW.setflags(write=False)
+
+
+def _next_object_id():
+    """Return a new (per process) unique object ID."""
+    return uuid.UUID(int=next(_OBJECT_IDS), version=4)
+
+
+def _minmax(x, chunk_size=2**18):
+    """Get min and max of `x` in a single sweep over memory.
+
+    Computing both per chunk means the second reduction runs on data that
+    is still in the CPU cache - this is noticeably faster than calling
+    `x.min()` and `x.max()` separately for large arrays.
+
+    """
+    # Non-contiguous arrays would be copied by ravel()
+    if not x.flags.forc or x.size <= chunk_size:
+        return x.min(), x.max()
+
+    x = x.ravel(order="K")
+    mins, maxs = [], []
+    for i in range(0, x.size, chunk_size):
+        chunk = x[i : i + chunk_size]
+        mins.append(chunk.min())
+        maxs.append(chunk.max())
+
+    return np.min(mins), np.max(maxs)
+
+
+def _mesh_arrays(mesh):
+    """Get positions and indices for a mesh-like in the format pygfx expects.
+
+    For trimesh.Trimesh the converted arrays are cached and re-used for as
+    long as the mesh does not change. Note that we only cache the (host)
+    arrays: each geometry gets its own GPU buffers which are freed together
+    with the visual.
+
+    """
+    if not isinstance(mesh, tm.Trimesh):
+        return _as_float32(mesh.vertices), _as_int32(mesh.faces)
+
+    cached = _trimesh_cache(mesh)
+    if "positions" not in cached:
+        cached["positions"] = _as_float32(mesh.vertices)
+        cached["indices"] = _as_int32(mesh.faces)
+
+    return cached["positions"], cached["indices"]
+
+
+def _mesh_normals(mesh):
+    """Get (cached) float32 vertex normals for a trimesh.Trimesh."""
+    cached = _trimesh_cache(mesh)
+    if "normals" not in cached:
+        cached["normals"] = _as_float32(mesh.vertex_normals)
+
+    return cached["normals"]
+
+
+def _trimesh_cache(mesh):
+    """Get the (up-to-date) cache entry for a trimesh.Trimesh."""
+    # Note: we key by identity because trimesh hashes are content-based and
+    # hence change whenever the mesh is modified
+    key = id(mesh)
+    mesh_hash = hash(mesh)
+    cached = _TRIMESH_ARRAYS.get(key)
+    if cached is None:
+        # Drop the cached arrays when the mesh is garbage collected (i.e.
+        # before its id can be re-used)
+        ref = weakref.ref(mesh, lambda _, key=key: _TRIMESH_ARRAYS.pop(key, None))
+    elif cached["hash"] != mesh_hash:
+        # Mesh has changed -> overwrite the stale arrays
+        ref = cached["ref"]
+    else:
+        return cached
+
+    cached = {"ref": ref, "hash": mesh_hash}
+    _TRIMESH_ARRAYS[key] = cached
+
+    return cached
+
+
+def _as_float32(x):
+    """Return `x` as C-contiguous float32 array; copies only if needed."""
+    if isinstance(x, np.ndarray) and x.dtype == np.float32 and x.flags.c_contiguous:
+        return x
+    return np.ascontiguousarray(x, dtype=np.float32)
+
+
+def _as_int32(x):
+    """Return `x` as C-contiguous int32 array; copies only if needed."""
+    if isinstance(x, np.ndarray) and x.dtype == np.int32 and x.flags.c_contiguous:
+        return x
+    return np.ascontiguousarray(x, dtype=np.int32)
+
 
 def mesh2gfx(mesh, color, alpha=None):
     """Convert generic mesh to pygfx visuals.
@@ -34,24 +145,11 @@ def mesh2gfx(mesh, color, alpha=None):
 
     # Parse color
     mat_color_kwargs, obj_color_kwargs = parse_mesh_color(mesh, color, alpha)
-    # In theory we should be able to change pick_write on-the-fly since pygfx 0.3.0
-    # But that doesn't seem to be the case.
-    mat_color_kwargs['pick_write'] = True
-
-    vis = gfx.Mesh(
-        gfx.Geometry(
-            indices=mesh.faces.astype(np.int32, copy=False),
-            positions=mesh.vertices.astype(np.float32, copy=False),
-            **obj_color_kwargs,
-        ),
-        gfx.MeshPhongMaterial(**mat_color_kwargs),
-    )
 
-    # Add custom attributes
-    vis._object_type = "mesh"
-    vis._object_id = uuid.uuid4()
+    positions, indices = _mesh_arrays(mesh)
+    geometry = gfx.Geometry(indices=indices, positions=positions, **obj_color_kwargs)
 
-    return vis
+    return _make_mesh_visual(geometry, mat_color_kwargs)
 
 
 def geometry2gfx(geometry, color, alpha=None):
@@ -76,39 +174,55 @@ def geometry2gfx(geometry, color, alpha=None):
     if "colors" in obj_color_kwargs:
         geometry.colors = obj_color_kwargs["colors"]
 
+    return _make_mesh_visual(geometry, mat_color_kwargs)
+
+
+def _make_mesh_visual(geometry, mat_color_kwargs):
+    """Combine geometry and (Phong) material into a gfx.Mesh visual."""
     # In theory we should be able to change pick_write on-the-fly since pygfx 0.3.0
     # But that doesn't seem to be the case.
-    mat_color_kwargs['pick_write'] = True
-
-    vis = gfx.Mesh(geometry, gfx.MeshPhongMaterial(**mat_color_kwargs))
+    vis = gfx.Mesh(
+        geometry, gfx.MeshPhongMaterial(pick_write=True, **mat_color_kwargs)
+    )
 
     # Add custom attributes
     vis._object_type = "mesh"
-    vis._object_id = uuid.uuid4()
+    vis._object_id = _next_object_id()
 
     return vis
 
 
 def parse_mesh_color(mesh, color, alpha=None):
     """Parse color for mesh plotting."""
+    # Fast path for the most common case: a single color without alpha
+    if alpha is None and not (isinstance(color, np.ndarray) and color.ndim == 2):
+        return {"color": color}, {}
+
     mat_color_kwargs = dict()
     obj_color_kwargs = dict()
     if isinstance(color, np.ndarray) and color.ndim == 2:
         if alpha is not None:
-            if color.shape[1] == 3:
-                color = np.hstack((color, np.ones((color.shape[0], 1))))
-            elif color.shape[1] != 4:
+            if color.shape[1] not in (3, 4):
                 raise ValueError("Expected colors to have 3 or 4 channels.")
-            color[:, -1] = alpha
-
+            # Write into a new float32 array instead of modifying the input
+            rgba = np.empty((color.shape[0], 4), dtype=np.float32)
+            rgba[:, :3] = color[:, :3]
+            rgba[:, 3] = alpha
+            color = rgba
         # Make sure the color is what pygfx expects
-        if color.dtype in (np.float64,):
+        elif color.dtype in (np.float64,):
             color = color.astype(np.float32, copy=False)
 
-        if len(color) == len(mesh.vertices):
+        # Note: this may also be a pygfx Geometry (see `geometry2gfx`)
+        if isinstance(mesh, gfx.Geometry):
+            n_vertices, n_faces = mesh.positions.nitems, mesh.indices.nitems
+        else:
+            n_vertices, n_faces = len(mesh.vertices), len(mesh.faces)
+
+        if len(color) == n_vertices:
             obj_color_kwargs = dict(colors=color)
             mat_color_kwargs = dict(color_mode="vertex")
-        elif len(color) == len(mesh.faces):
+        elif len(color) == n_faces:
             obj_color_kwargs = dict(colors=color)
             mat_color_kwargs = dict(color_mode="face")
         else:
@@ -126,23 +240,34 @@ def parse_mesh_color(mesh, color, alpha=None):
 
 
 def color_to_texture(color, N=256, gamma=1.0, fade=True):
-    """Convert a given color to a pygfx Texture."""
-    # First force RGB
-    stop = gfx.Color(color).rgba
-    stop = (stop.r, stop.g, stop.b, 1.0)  # make sure alpha is 1
-    start = gfx.Color(color if not fade else "k").rgba
-    start = (start.r, start.g, start.b, 0)  # make sure alpha is 0
+    """Convert a given color to a pygfx Texture.
 
-    # Need to double check that pygfx properly interpolates the color
-    colormap_data = np.vstack((start, stop)).astype(np.float32, copy=False)
+    Note that the colormap data is cached, i.e. Textures for the same color
+    will share the same (read-only) data array.
+
+    """
+    # Canonicalize the color so that e.g. "red" and "#ff0000" share the data
+    return gfx.Texture(_color_to_colormap(tuple(gfx.Color(color).rgb), fade), dim=1)
+
+
+@lru_cache(maxsize=256)
+def _color_to_colormap(color, fade):
+    """Cached colormap data for `color_to_texture`."""
+    stop = gfx.Color(color)
+    start = gfx.Color(color if not fade else "k")
 
     # Important note:
     # It looks that as things stand now, pygfx expects the colormap to be only
-    # rgb, not rgba. So we need to remove the alpha channel.
-    colormap_data = colormap_data[:, :3]
+    # rgb, not rgba. So we build the colormap without an alpha channel.
+    # Need to double check that pygfx properly interpolates the color
+    colormap_data = np.array(
+        [[start.r, start.g, start.b], [stop.r, stop.g, stop.b]], dtype=np.float32
+    )
 
-    # Convert to vispy cmap
-    return gfx.Texture(colormap_data, dim=1)
+    # Make sure that in-place modifications of the shared data fail loudly
+    colormap_data.setflags(write=False)
+
+    return colormap_data
 
 
 def volume2gfx(
@@ -215,17 +340,36 @@ def volume2gfx(
         spacing = [spacing] * 3
     assert len(spacing) == 3, "Expected spacing as tuple of length 3."
 
-    # Similar to vispy, pygfx seems to expect zyx coordinate space
-    grid = vol.T
-
-    # Convert to data type that pygfx can handle:
-    # Convert non-native byte order to native; e.g. >u4 -> u4 = uint64
-    if grid.dtype.byteorder in (">", "<"):
-        grid = grid.astype(grid.dtype.str.replace(grid.dtype.byteorder, ""))
+    # Convert to data type that pygfx can handle. Note that we do this on the
+    # original array so that any copy is made in its native memory order.
+    data_range = None
     # Convert boolean matrices to uint16; I tried uint4 but that renders as
     # uniform volume and uint8 looks fuzzy
-    elif grid.dtype == bool:
-        grid = grid.astype(np.uint16)
+    if vol.dtype == bool:
+        dtype = np.dtype(np.uint16)
+    # GPUs don't support 64bit textures -> downcast to the 32bit variant
+    elif vol.dtype.kind in "iuf" and vol.dtype.itemsize == 8:
+        dtype = np.dtype(f"{vol.dtype.kind}4")
+        # Make sure integers (e.g. segmentation IDs) don't silently wrap around
+        if dtype.kind in "iu":
+            data_range = _minmax(vol)
+            info = np.iinfo(dtype)
+            if data_range[0] < info.min or data_range[1] > info.max:
+                raise ValueError(
+                    f"Values of {vol.dtype} volume ({data_range[0]} to "
+                    f"{data_range[1]}) exceed the range of {dtype} which is "
+                    "the largest integer type supported by the GPU. Please "
+                    "relabel or rescale the data."
+                )
+    # Convert non-native byte order to native; e.g. >u4 -> u4
+    else:
+        dtype = vol.dtype.newbyteorder("=")
+    if vol.dtype != dtype:
+        vol = vol.astype(dtype)
+
+    # Similar to vispy, pygfx seems to expect zyx coordinate space
+    # Note that this is a zero-copy view which pygfx accepts as is
+    grid = vol.T
 
     # Find the potential min/max value of the volume
     if isinstance(clim, str):
@@ -238,10 +382,16 @@ def volume2gfx(
     else:
         cmin, cmax = clim
 
+    # Get min/max of the data in a single sweep if required
+    if "data" in (cmin, cmax):
+        if data_range is None:
+            data_range = _minmax(grid)
+        data_min, data_max = data_range
+
     if cmin == "datatype":
         cmin = 0
     elif cmin == "data":
-        cmin = grid.min()
+        cmin = data_min
 
     if cmax == "datatype":
         # If float, assume that the data is normalized
@@ -251,7 +401,7 @@ def volume2gfx(
         else:
             cmax = np.iinfo(grid.dtype).max
     elif cmax == "data":
-        cmax = grid.max()
+        cmax = data_max
 
     # Initialize texture
     tex = gfx.Texture(grid, dim=3)
@@ -299,16 +449,12 @@ def volume2gfx(
     # Set scales and offset
     for vis in visuals:
         vis.material.opacity = opacity
-        (
-            vis.local.scale_x,
-            vis.local.scale_y,
-            vis.local.scale_z,
-        ) = spacing
-        (vis.local.x, vis.local.y, vis.local.z) = offset
+        vis.local.scale = tuple(spacing)
+        vis.local.position = tuple(offset)
 
         # Add custom attributes
         vis._object_type = "volume"
-        vis._object_id = uuid.uuid4()
+        vis._object_id = _next_object_id()
 
         # Note: to trigger an update of the colormap data later:
         # vis.material.data[:, 1] = 0
@@ -343,9 +489,9 @@ def to_colormap(x, hide_zero):
     if hide_zero:
         # Add an alpha column if needed
         if tex.data.shape[1] == 3:
-            colors = np.hstack(
-                (tex.data, np.ones((tex.data.shape[0], 1))), dtype=tex.data.dtype
-            )
+            colors = np.empty((tex.data.shape[0], 4), dtype=tex.data.dtype)
+            colors[:, :3] = tex.data
+            colors[:, 3] = 1
             tex = gfx.Texture(colors, dim=1)
         # Otherwise make a copy to avoid modifying the original data
         else:
@@ -390,11 +536,8 @@ def points2gfx(points, color, size=2, marker=None, size_space="screen"):
     assert points.ndim == 2, "Expected 2D numpy array."
     assert points.shape[1] == 3, "Expected (N, 3) array."
 
-    points = points.astype(np.float32, copy=False)
-
-    # Make sure coordinates are c-contiguous
-    if not points.flags["C_CONTIGUOUS"]:
-        points = np.ascontiguousarray(points)
+    # Make sure coordinates are c-contiguous float32
+    points = _as_float32(points)
 
     geometry_kwargs = {}
     material_kwargs = {}
@@ -409,7 +552,7 @@ def points2gfx(points, color, size=2, marker=None, size_space="screen"):
                 "Expected `size` to be a single value or "
                 "an array of the same length as `points`."
             )
-        geometry_kwargs["sizes"] = np.asarray(size).astype(np.float32, copy=False)
+        geometry_kwargs["sizes"] = _as_float32(size)
         material_kwargs["size_mode"] = "vertex"
     else:
         material_kwargs["size"] = size
@@ -421,12 +564,12 @@ def points2gfx(points, color, size=2, marker=None, size_space="screen"):
         n_points = len(points)
         if len(color) != n_points:
             raise ValueError(f"Got {len(color)} colors for {n_points} points.")
-        color = color.astype(np.float32, copy=False)
+        color = _as_float32(color)
         geometry_kwargs["colors"] = color
         material_kwargs["color_mode"] = "vertex"
     else:
         if isinstance(color, np.ndarray):
-            color = color.astype(np.float32, copy=False)
+            color = _as_float32(color)
         material_kwargs["color"] = color
 
     if marker is None:
@@ -440,7 +583,7 @@ def points2gfx(points, color, size=2, marker=None, size_space="screen"):
 
     # Add custom attributes
     vis._object_type = "points"
-    vis._object_id = uuid.uuid4()
+    vis._object_id = _next_object_id()
 
     return vis
 
@@ -481,24 +624,26 @@ def lines2gfx(lines, color, linewidth=1, linewidth_space="screen", dash_pattern=
         assert lines.shape[1] == 3
         assert len(lines) > 1
     elif isinstance(lines, list):
-        assert all([isinstance(l, np.ndarray) for l in lines])
-        assert all([l.ndim == 2 for l in lines])
-        assert all([l.shape[1] == 3 for l in lines])
-        assert all([len(l) > 1 for l in lines])
+        # Check all lines in a single pass
+        for l in lines:
+            assert isinstance(l, np.ndarray)
+            assert l.ndim == 2 and l.shape[1] == 3 and len(l) > 1
 
         # Convert to the (N, 3) format
         if len(lines) == 1:
             lines = lines[0]
         else:
-            lines = np.insert(
-                np.vstack(lines),
-                np.cumsum([len(l) for l in lines[:-1]]),
-                np.nan,
-                axis=0,
-            )
+            # Concatenate lines with a NaN row between each line in a single
+            # copy - this is much faster than np.insert for many lines
+            parts = [_NAN_ROW] * (len(lines) * 2 - 1)
+            parts[::2] = lines
+            lines = np.concatenate(parts, axis=0, dtype=np.float32)
     else:
         raise TypeError("Expected numpy array or list of numpy arrays.")
 
+    # Make sure coordinates are c-contiguous float32 (no-op if they already are)
+    lines = _as_float32(lines)
+
     if dash_pattern is None:
         dash_pattern = ()  # pygfx expects an empty tuple for solid lines
     elif isinstance(dash_pattern, str):
@@ -522,27 +667,30 @@ def lines2gfx(lines, color, linewidth=1, linewidth_space="screen", dash_pattern=
 
     # Parse color(s)
     if isinstance(color, np.ndarray) and color.ndim == 2:
+        color = _as_float32(color)
+
         # If colors are provided for each node we have to make sure
         # that we also include `None` for the breaks in the segments
 
         # See if we can rescue this if there is now a mismatch in the
         # number of colors and points
         if len(color) != len(lines):
-            # Count the number of non-NaN points
-            n_points = (~np.isnan(lines[:, 0])).sum()
-            if n_points != len(lines):
-                if len(color) == n_points:
-                    breaks = np.where(np.isnan(lines[:, 0]))[0]
-                    offset = np.arange(len(breaks))
-                    color = np.insert(color, breaks - offset, np.nan, axis=0)
-                else:
-                    raise ValueError(f"Got {len(color)} colors for {n_points} points.")
-        color = color.astype(np.float32, copy=False)
+            # Count the number of non-NaN points (single pass over the data)
+            is_break = np.isnan(lines[:, 0])
+            n_points = len(lines) - np.count_nonzero(is_break)
+            if len(color) != n_points:
+                raise ValueError(f"Got {len(color)} colors for {n_points} points.")
+            # Scatter colors into the non-break rows in one go instead
+            # of inserting NaNs one break at a time
+            new_color = np.empty((len(lines), color.shape[1]), dtype=np.float32)
+            new_color[~is_break] = color
+            new_color[is_break] = np.nan
+            color = new_color
         geometry_kwargs["colors"] = color
         material_kwargs["color_mode"] = "vertex"
     else:
         if isinstance(color, np.ndarray):
-            color = color.astype(np.float32, copy=False)
+            color = _as_float32(color)
         material_kwargs["color"] = color
 
     if linewidth > 0:
@@ -558,61 +706,109 @@ def lines2gfx(lines, color, linewidth=1, linewidth_space="screen", dash_pattern=
         )
 
     vis = gfx.Line(
-        gfx.Geometry(positions=lines.astype(np.float32, copy=False), **geometry_kwargs),
+        gfx.Geometry(positions=lines, **geometry_kwargs),
         mat,
     )
 
     # Add custom attributes
     vis._object_type = "lines"
-    vis._object_id = uuid.uuid4()
+    vis._object_id = _next_object_id()
 
     return vis
 
 
-def trimesh2gfx(mesh, color=None, alpha=None, use_material=True):
+def trimesh2gfx(mesh, color=None, alpha=None, use_material=True, compute_normals=True):
     """Convert trimesh to pygfx visual.
 
     Importantly, this function will also try to extract textures
     if applicable.
 
+    Parameters
+    ----------
+    mesh :          trimesh.Trimesh
+                    Mesh to convert.
+    use_material :  bool
+                    Whether to use the mesh's material (including
+                    textures) if it has one.
+    compute_normals : bool
+                    Whether to compute vertex normals using trimesh (requires
+                    scipy). Normals are cached per mesh and hence shared
+                    between conversions. If False, will only use normals
+                    that trimesh has already loaded or computed and otherwise
+                    let pygfx generate (non-weighted) normals for each visual.
+
     """
     assert isinstance(mesh, tm.Trimesh), f"Expected trimesh.Trimesh, got {type(mesh)}."
 
-    kwargs = dict(
-        positions=np.ascontiguousarray(mesh.vertices, dtype="f4"),
-        indices=np.ascontiguousarray(mesh.faces, dtype="i4"),
-    )
-    # trimesh needs scipy to compute normals
-    if find_spec("scipy"):
-        kwargs['normals'] = np.ascontiguousarray(mesh.vertex_normals, dtype="f4")
+    # Note: we always generate a new geometry (which may be modified downstream,
+    # e.g. by `geometry2gfx`) but re-use the converted position and index arrays
+    geometry = _geometry_from_trimesh(mesh, compute_normals=compute_normals)
 
+    # If we have a material (including a texture)
+    material = None
+    if hasattr(mesh.visual, "material") and use_material:
+        # The material can be a PBRMaterial or a SimpleMaterial
+        # pygfx' helper method only supports PBRMaterials
+        if isinstance(mesh.visual.material, tm.visual.material.PBRMaterial):
+            material = gfx.material_from_trimesh(mesh.visual.material)
+        elif isinstance(mesh.visual.material, tm.visual.material.SimpleMaterial):
+            material = simple_material_from_trimesh(mesh.visual.material)
+
+    # Only generate the default material if we actually need it
+    if material is None:
+        material = gfx.MeshPhongMaterial()
+
+    return gfx.Mesh(geometry, material)
+
+
+def _geometry_from_trimesh(mesh, compute_normals=True):
+    """Generate pygfx Geometry from a trimesh.Trimesh."""
+    positions, indices = _mesh_arrays(mesh)
+    kwargs = dict(positions=positions, indices=indices)
+    # Use normals if trimesh already has them (e.g. loaded from file) or
+    # compute them if asked to. Otherwise pygfx will generate them on the CPU
+    # every time it (re-)builds the shader bindings for a visual.
+    # Note: trimesh needs scipy to compute normals
+    if "vertex_normals" in mesh._cache or (compute_normals and find_spec("scipy")):
+        kwargs["normals"] = _mesh_normals(mesh)
+
+    kwargs.update(_visual_arrays(mesh))
+
+    return gfx.Geometry(**kwargs)
+
+
+def _visual_arrays(mesh):
+    """Get (cached) texture coordinates or vertex colors for a trimesh.Trimesh."""
+    # The visual has its own (content-based) hash
+    cached = _trimesh_cache(mesh)
+    visual_hash = hash(mesh.visual)
+    if cached.get("visual_hash") == visual_hash:
+        return cached["visual"]
+
+    kwargs = {}
     if mesh.visual.kind == "texture" and getattr(mesh.visual, "uv", None) is not None:
         # convert the uv coordinates from opengl to wgpu conventions.
         # wgpu uses the D3D and Metal coordinate systems.
         # the coordinate origin is in the upper left corner, while the opengl coordinate
         # origin is in the lower left corner.
         # trimesh loads textures according to the opengl coordinate system.
-        wgpu_uv = mesh.visual.uv * np.array([1, -1]) + np.array(
-            [0, 1]
-        )  # uv.y = 1 - uv.y
-        kwargs["texcoords"] = np.ascontiguousarray(wgpu_uv, dtype="f4")
+        # Note: we write straight into a float32 array to avoid temporaries
+        uv = mesh.visual.uv
+        texcoords = np.empty((len(uv), 2), dtype=np.float32)
+        texcoords[:, 0] = uv[:, 0]
+        np.subtract(1, uv[:, 1], out=texcoords[:, 1], dtype=np.float32)  # uv.y = 1 - uv.y
+        kwargs["texcoords"] = texcoords
     elif mesh.visual.kind == "vertex":
-        kwargs["colors"] = np.ascontiguousarray(mesh.visual.vertex_colors, dtype="f4")
-
-    # Generate the geometry
-    vis = gfx.Mesh(gfx.Geometry(**kwargs), gfx.MeshPhongMaterial())
+        # trimesh stores vertex colors as uint8 (0-255) but pygfx expects 0-1
+        vertex_colors = mesh.visual.vertex_colors
+        colors = np.empty(vertex_colors.shape, dtype=np.float32)
+        np.multiply(vertex_colors, 1 / 255, out=colors, dtype=np.float32)
+        kwargs["colors"] = colors
 
-    # If we have a material (including a texture)
-    if hasattr(mesh.visual, "material") and use_material:
-        material = mesh.visual.material
-        # The material can be a PBRMaterial or a SimpleMaterial
-        # pygfx' helper method only supports PBRMaterials
-        if isinstance(material, tm.visual.material.PBRMaterial):
-            vis.material = gfx.material_from_trimesh(material)
-        elif isinstance(material, tm.visual.material.SimpleMaterial):
-            vis.material = simple_material_from_trimesh(material)
+    cached["visual_hash"] = visual_hash
+    cached["visual"] = kwargs
 
-    return vis
+    return kwargs
 
 
 def simple_material_from_trimesh(material):
@@ -652,6 +848,12 @@ def texture_from_pillow_image(image, dim=2, **kwargs):
 
     Create a Texture from a PIL.Image.
 
+    Note that textures are cached by image identity, i.e. repeated calls
+    with the same image object will return the same Texture object. The
+    image's content is not checked: if you modify an image in place after
+    converting it, the stale texture will be returned. Passing any
+    additional `kwargs` bypasses the cache.
+
     Parameters
     ----------
     image : Image
@@ -669,21 +871,41 @@ def texture_from_pillow_image(image, dim=2, **kwargs):
         A texture object representing the given image.
 
     """
+    # Re-use the texture if this image has already been converted (e.g. if
+    # it is shared between multiple materials in a scene)
+    key = (id(image), dim)
+    if not kwargs and key in _PILLOW_TEXTURES:
+        return _PILLOW_TEXTURES[key][1]
+    source = image
+
     # If this is a palette image, convert it to RGBA
     if getattr(image, "mode", None) == "P":
         image = image.convert("RGBA")
 
-    m = memoryview(image.tobytes())
+    # Note: this gives us the (height, width, channels) layout pygfx expects
+    # (`image.size` is (width, height) and therefore doesn't work for non-square
+    # images) without an intermediate bytes copy
+    data = np.asarray(image)
+    if data.ndim == 2:
+        data = data[..., np.newaxis]
 
-    im_channels = len(image.getbands())
-    buffer_shape = image.size + (im_channels,)
+    tex = gfx.Texture(np.ascontiguousarray(data), dim=dim, **kwargs)
 
-    m = m.cast(m.format, shape=buffer_shape)
-    return gfx.Texture(m, dim=dim, **kwargs)
+    # Drop the cached texture when the image is garbage collected (i.e. before
+    # its id can be re-used)
+    if not kwargs:
+        ref = weakref.ref(source, lambda _, key=key: _PILLOW_TEXTURES.pop(key, None))
+        _PILLOW_TEXTURES[key] = (ref, tex)
+
+    return tex
 
 
 # Monkey-patch the pygfx texture_from_pillow_image function
-gfx.materials._compat.texture_from_pillow_image = texture_from_pillow_image
+# (this is a private module that may not exist in all pygfx versions)
+try:
+    gfx.materials._compat.texture_from_pillow_image = texture_from_pillow_image
+except AttributeError:
+    pass
 
 
 def scene2gfx(scene):
@@ -698,13 +920,16 @@ def scene2gfx(scene):
     for node_name in scene.graph.nodes_geometry:
         transform, geometry_name = scene.graph[node_name]
 
+        # Instances of the same geometry share geometry and material (i.e.
+        # the GPU buffers) and only differ in their transform
         if geometry_name not in gfx_geometries:
-            gfx_geometries[geometry_name] = trimesh2gfx(scene.geometry[geometry_name])
-
-        vis = gfx.Mesh(
-            gfx_geometries[geometry_name].geometry,
-            gfx_geometries[geometry_name].material,
-        )
+            vis = trimesh2gfx(scene.geometry[geometry_name])
+            gfx_geometries[geometry_name] = vis
+        else:
+            vis = gfx.Mesh(
+                gfx_geometries[geometry_name].geometry,
+                gfx_geometries[geometry_name].material,
+            )
         vis.local.matrix = transform
 
         visuals.append(vis)
@@ -1,22 +1,43 @@
 import re
 
 from setuptools import setup, find_packages
-from extreqs import parse_requirement_files
 from pathlib import Path
 
+HERE = Path(__file__).resolve().parent
+
 VERSIONFILE = "octarine/__version__.py"
-verstrline = open(VERSIONFILE, "rt").read()
-VSRE = r"^__version__ = ['\"]([^'\"]*)['\"]"
-mo = re.search(VSRE, verstrline, re.M)
+VSRE = re.compile(r"^__version__ = ['\"]([^'\"]*)['\"]", re.M)
+mo = VSRE.search((HERE / VERSIONFILE).read_text(encoding="utf-8"))
 if mo:
     verstr = mo.group(1)
 else:
     raise RuntimeError("Unable to find version string in %s." % (VERSIONFILE,))
 
-HERE = Path(__file__).resolve().parent
-install_requires, extras_require = parse_requirement_files(
-    HERE / "requirements.txt",
-)
+
+def parse_requirements(path):
+    """Parse requirements file into install and extra requirements.
+
+    Requirements following an `#extra: <name>` line are assigned to
+    that extra.
+
+    """
+    install_requires, extras_require = [], {}
+    current = install_requires
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        extra = re.match(r"#\s*extra:(.*)", line)
+        if extra:
+            current = extras_require.setdefault(extra.group(1).strip(), [])
+            continue
+        # Drop comments (including inline comments) but keep e.g. the
+        # `#egg=` or `#sha256=` fragments of direct references
+        line = "" if line.startswith("#") else re.split(r"\s+#", line)[0]
+        if line:
+            current.append(line)
+    return install_requires, extras_require
+
+
+install_requires, extras_require = parse_requirements(HERE / "requirements.txt")
 
 
 setup(
@@ -25,7 +46,7 @@ setup(
     packages=find_packages(),
     license='BSD-2-Clause',
     description='WGPU-based 3d viewer',
-    long_description=open('README.md').read(),
+    long_description=(HERE / "README.md").read_text(encoding="utf-8"),
     long_description_content_type='text/markdown',
     url='https://github.com/schlegelp/octarine',
     project_urls={
@@ -0,0 +1,33 @@
+import runpy
+import setuptools
+
+from pathlib import Path
+
+SETUP_PY = Path(__file__).resolve().parent.parent / "setup.py"
+
+
+def test_parse_requirements(monkeypatch, tmp_path):
+    # Run setup.py without actually calling setuptools.setup
+    monkeypatch.setattr(setuptools, "setup", lambda **kwargs: None)
+    parse_requirements = runpy.run_path(str(SETUP_PY))["parse_requirements"]
+
+    # Check the grouping of the actual requirements file
+    install, extras = parse_requirements(SETUP_PY.parent / "requirements.txt")
+    assert "numpy" in install
+    assert "importlib-metadata>=4.6" in install
+    assert set(extras) == {"all", "docs", "dev"}
+    assert "ipywidgets" in extras["all"]
+    assert "mkdocs" in extras["docs"]
+    assert extras["dev"] == ["pytest"]
+
+    # Direct references must keep their URL fragments
+    req = tmp_path / "requirements.txt"
+    req.write_text(
+        "# comment\n"
+        "pkg @ git+https://example.com/pkg.git#egg=pkg  # inline comment\n"
+        "#extra: dev\n"
+        "other @ https://example.com/other.whl#sha256=abc\n"
+    )
+    install, extras = parse_requirements(req)
+    assert install == ["pkg @ git+https://example.com/pkg.git#egg=pkg"]
+    assert extras == {"dev": ["other @ https://example.com/other.whl#sha256=abc"]}
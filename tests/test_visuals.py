@@ -4,8 +4,16 @@ import octarine as oc
 import trimesh as tm
 import numpy as np
 
-# Set random state
-np.random.seed(0)
+# Local random state (avoids mutating numpy's global state)
+RNG = np.random.default_rng(0)
+
+
+@pytest.fixture(scope="module")
+def viewer():
+    # Share a single viewer to avoid re-initializing the WGPU device per test
+    v = oc.Viewer(offscreen=True)
+    yield v
+    v.close()
 
 
 @pytest.fixture
@@ -13,39 +21,123 @@ def mesh():
     return tm.creation.icosphere()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def line_single():
-    return np.random.rand(10, 3)
+    return RNG.random((10, 3))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def line_stack():
-    return [np.random.rand(i, 3) for i in np.random.randint(2, 10, 10)]
+    return [RNG.random((i, 3)) for i in RNG.integers(2, 10, 10)]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def points():
-    return np.random.rand(10, 3)
+    return RNG.random((10, 3))
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def points_colors():
-    return np.random.rand(10, 3), np.random.rand(10, 3)
+    return RNG.random((10, 3)), RNG.random((10, 3))
 
 
-def test_adding_generic_objects(mesh, line_single, line_stack, points, points_colors):
-    v = oc.Viewer(offscreen=True)
-
+def test_adding_generic_objects(
+    viewer, mesh, line_single, line_stack, points, points_colors
+):
     # Test adding objects generically
-    for ob in [mesh, line_single, line_stack, points, points_colors]:
-        v.add(ob)
-        v.clear()
+    try:
+        for ob in [mesh, line_single, line_stack, points, points_colors]:
+            viewer.add(ob)
+            viewer.clear()
+    finally:
+        viewer.clear()
 
-    v.close()
 
+@pytest.mark.parametrize("color", [None, "red", "random"])
+def test_adding_mesh(viewer, mesh, color):
+    if color == "random":
+        color = np.random.default_rng(0).random(3)
 
-@pytest.mark.parametrize("color", [None, "red", np.random.rand(3)])
-def test_adding_mesh(mesh, color):
-    v = oc.Viewer(offscreen=True)
-    v.add_mesh(mesh, color=color)
-    v.close()
+    try:
+        viewer.add_mesh(mesh, color=color)
+    finally:
+        viewer.clear()
+
+
+def test_volume_64bit():
+    vol = np.arange(27, dtype=np.uint64).reshape(3, 3, 3)
+    vis = oc.visuals.volume2gfx(vol, color="viridis")[0]
+    assert vis.geometry.grid.data.dtype == np.uint32
+    assert vis.material.clim == (0, 26)
+
+    # Values that don't fit into 32 bits must not silently wrap around
+    vol[0, 0, 0] = 2**40
+    with pytest.raises(ValueError):
+        oc.visuals.volume2gfx(vol, color="viridis")
+
+
+@pytest.mark.parametrize("mode", ["RGB", "L"])
+def test_texture_from_pillow_image(mode):
+    from PIL import Image
+
+    # Non-square image to make sure width and height aren't swapped
+    data = RNG.integers(0, 256, (4, 6, 3), dtype=np.uint8)
+    if mode == "L":
+        data = data[..., 0]
+    image = Image.fromarray(data, mode=mode)
+
+    tex = oc.visuals.texture_from_pillow_image(image)
+    channels = 3 if mode == "RGB" else 1
+    assert tex.data.shape == (4, 6, channels)
+    assert np.array_equal(tex.data.reshape(data.shape), data)
+
+
+def test_geometry_colors(mesh):
+    geometry = oc.visuals.trimesh2gfx(mesh).geometry
+
+    colors = RNG.random((len(mesh.vertices), 3))
+    vis = oc.visuals.geometry2gfx(geometry, color=colors)
+    assert vis.material.color_mode == "vertex"
+
+    colors = RNG.random((len(mesh.faces), 3))
+    vis = oc.visuals.geometry2gfx(geometry, color=colors)
+    assert vis.material.color_mode == "face"
+
+
+def test_parse_mesh_color_readonly(mesh):
+    colors = RNG.random((len(mesh.vertices), 4))
+    colors.setflags(write=False)
+    original = colors.copy()
+
+    mat_kwargs, obj_kwargs = oc.visuals.parse_mesh_color(mesh, colors, alpha=0.5)
+
+    # Input must not be modified
+    assert np.array_equal(colors, original)
+
+    out = obj_kwargs["colors"]
+    assert out.dtype == np.float32
+    assert out.shape == (len(mesh.vertices), 4)
+    assert np.allclose(out[:, :3], original[:, :3])
+    assert np.all(out[:, 3] == 0.5)
+    assert mat_kwargs["color_mode"] == "vertex"
+
+
+def test_lines_colors():
+    lines = [RNG.random((i, 3)) for i in (2, 5, 3)]
+    colors = RNG.random((10, 4))
+
+    vis = oc.visuals.lines2gfx(lines, color=colors)
+    positions = vis.geometry.positions.data
+    new_colors = vis.geometry.colors.data
+
+    # Lines are separated by NaN rows...
+    is_break = np.isnan(positions[:, 0])
+    assert np.array_equal(np.where(is_break)[0], [2, 8])
+    # ... and so are the colors
+    assert np.all(np.isnan(new_colors[is_break]))
+    assert np.allclose(new_colors[~is_break], colors)
+    assert np.allclose(positions[~is_break], np.vstack(lines))
+
+    # Mismatch between number of colors and points
+    with pytest.raises(ValueError):
+        oc.visuals.lines2gfx(lines, color=colors[:-1])